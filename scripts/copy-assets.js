@@ -4,6 +4,7 @@ const fs = require("fs");
 const fsPromises = require("fs").promises;
 const path = require("path");
 const { spawn } = require("child_process");
+const { downloadFile } = require("./download-file");
 
 // Legacy injectUtil removed. Using native addon instead.
 
@@ -240,27 +241,8 @@ async function downloadPhotonIfNeeded(zipPath) {
   const PHOTON_URL =
     "https://github.com/connors/photon/archive/v0.1.2-alpha.zip";
 
-  return new Promise((resolve, reject) => {
-    const curl = spawn("curl", ["-L", "-o", zipPath, PHOTON_URL]);
-
-    curl.stdout.on("data", (data) => {
-      console.log(`Downloading: ${data}`);
-    });
-
-    curl.stderr.on("data", (data) => {
-      // curl progress is sent to stderr, so we don't treat it as an error
-      console.log(`Download progress: ${data}`);
-    });
-
-    curl.on("close", (code) => {
-      if (code === 0) {
-        console.log(`Downloaded Photon to ${zipPath}`);
-        resolve();
-      } else {
-        reject(new Error(`Download failed with code ${code}`));
-      }
-    });
-  });
+  await downloadFile(PHOTON_URL, zipPath);
+  console.log(`Downloaded Photon to ${zipPath}`);
 }
 
 async function inflatePhotonZip(zipPath, destPath) {
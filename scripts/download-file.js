@@ -0,0 +1,59 @@
+const fs = require("fs");
+const https = require("https");
+const { pipeline } = require("stream");
+
+/**
+ * Download a URL to destPath, following redirects. The body is streamed to
+ * `${destPath}.partial` and renamed into place only once complete
+ * @param {string} url - URL to download
+ * @param {string} destPath - Destination file path
+ * @param {number} redirects - Redirects followed so far
+ * @returns {Promise<void>} Promise that resolves once destPath is written
+ */
+function downloadFile(url, destPath, redirects = 0) {
+  return new Promise((resolve, reject) => {
+    https
+      .get(url, (response) => {
+        const { statusCode, headers } = response;
+
+        // GitHub archive links redirect to codeload
+        if (statusCode >= 300 && statusCode < 400 && headers.location) {
+          response.resume();
+          if (redirects >= 5) {
+            reject(new Error("Download failed: too many redirects"));
+            return;
+          }
+          downloadFile(
+            new URL(headers.location, url).toString(),
+            destPath,
+            redirects + 1,
+          ).then(resolve, reject);
+          return;
+        }
+
+        if (statusCode !== 200) {
+          response.resume();
+          reject(new Error(`Download failed with HTTP ${statusCode}`));
+          return;
+        }
+
+        // Stream to a temp file so an interrupted download is never
+        // mistaken for a complete file on the next run
+        const partialPath = `${destPath}.partial`;
+        pipeline(response, fs.createWriteStream(partialPath), (error) => {
+          if (error) {
+            fs.rmSync(partialPath, { force: true });
+            reject(new Error(`Download failed: ${error.message}`));
+            return;
+          }
+          fs.renameSync(partialPath, destPath);
+          resolve();
+        });
+      })
+      .on("error", (error) => {
+        reject(new Error(`Download failed: ${error.message}`));
+      });
+  });
+}
+
+module.exports = { downloadFile };
@@ -23,6 +23,11 @@ export const WHISPER_CONFIG = {
   TRANSCRIPTION_TIMEOUT_MS: 180000,
 } as const;
 
+export const MODEL_DOWNLOAD_CONFIG = {
+  PARALLEL_CONNECTIONS: 4,
+  PARALLEL_MIN_BYTES: 100 * 1024 * 1024,
+} as const;
+
 export const WINDOW_CONFIG = {
   MARGIN_PX: 20,
 } as const;
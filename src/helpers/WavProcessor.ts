@@ -4,6 +4,7 @@ import { join } from "path";
 /**
  * Consolidated WAV file processing utility
  * Handles conversion of Float32Array audio data to WAV files
+ * (16-bit PCM by default, or 32-bit IEEE float to skip quantization)
  */
 export class WavProcessor {
   /**
@@ -18,38 +19,69 @@ export class WavProcessor {
       bitsPerSample?: number;
     } = {},
   ): Promise<string> {
-    const { sampleRate = 16000, numChannels = 1, bitsPerSample = 16 } = options;
-
     const tempPath = join(tempDir, `audio_${Date.now()}.wav`);
 
-    // Convert Float32Array to 16-bit PCM
-    const pcmData = new Int16Array(audioData.length);
-    for (let i = 0; i < audioData.length; i++) {
-      // Clamp to [-1, 1] and convert to 16-bit
-      const clamped = Math.max(-1, Math.min(1, audioData[i]));
-      pcmData[i] = Math.round(clamped * 32767);
+    // Write to file
+    writeFileSync(tempPath, this.encodeWav(audioData, options));
+
+    return tempPath;
+  }
+
+  /**
+   * Encode Float32Array audio data as an in-memory WAV buffer
+   */
+  static encodeWav(
+    audioData: Float32Array,
+    options: {
+      sampleRate?: number;
+      numChannels?: number;
+      bitsPerSample?: number;
+    } = {},
+  ): Buffer {
+    const { sampleRate = 16000, numChannels = 1, bitsPerSample = 16 } = options;
+
+    if (bitsPerSample !== 16 && bitsPerSample !== 32) {
+      throw new Error(
+        `Unsupported WAV bit depth: ${bitsPerSample} (expected 16 or 32)`,
+      );
     }
 
-    // Create WAV header
+    const dataLength = audioData.length * (bitsPerSample / 8);
+
+    // Allocate header and sample data as a single buffer so samples are
+    // written straight into their final location with no extra copy
+    const wavBuffer = new ArrayBuffer(44 + dataLength);
     const wavHeader = this.createWavHeader(
-      pcmData.length * 2,
+      dataLength,
       sampleRate,
       numChannels,
       bitsPerSample,
     );
+    new Uint8Array(wavBuffer).set(new Uint8Array(wavHeader), 0);
 
-    // Combine header and data
-    const wavBuffer = new ArrayBuffer(
-      wavHeader.byteLength + pcmData.byteLength,
-    );
-    const wavView = new Uint8Array(wavBuffer);
-    wavView.set(new Uint8Array(wavHeader), 0);
-    wavView.set(new Uint8Array(pcmData.buffer), wavHeader.byteLength);
-
-    // Write to file
-    writeFileSync(tempPath, Buffer.from(wavBuffer));
+    if (bitsPerSample === 32) {
+      // Store samples as-is; consumers that decode to float internally
+      // (e.g. whisper.cpp) avoid a lossy int16 round-trip
+      new Float32Array(wavBuffer, 44, audioData.length).set(audioData);
+    } else {
+      // Convert Float32Array to 16-bit PCM in a single pass. Scaling,
+      // clamping to [-32767, 32767] and rounding (Math.round is
+      // floor(x + 0.5)) are inlined so the loop stays a tight kernel
+      const length = audioData.length;
+      const pcmData = new Int16Array(wavBuffer, 44, length);
+      for (let i = 0; i < length; i++) {
+        const scaled = audioData[i] * 32767 + 0.5;
+        pcmData[i] =
+          scaled >= 32767
+            ? 32767
+            : scaled <= -32767
+              ? -32767
+              : Math.floor(scaled);
+      }
+    }
 
-    return tempPath;
+    // Wraps the ArrayBuffer without copying
+    return Buffer.from(wavBuffer);
   }
 
   /**
@@ -72,7 +104,7 @@ export class WavProcessor {
     // Format chunk
     view.setUint32(12, 0x666d7420, false); // "fmt "
     view.setUint32(16, 16, true); // Subchunk1Size
-    view.setUint16(20, 1, true); // AudioFormat (PCM)
+    view.setUint16(20, bitsPerSample === 32 ? 3 : 1, true); // AudioFormat (IEEE float or PCM)
     view.setUint16(22, numChannels, true); // NumChannels
     view.setUint32(24, sampleRate, true); // SampleRate
     view.setUint32(28, (sampleRate * numChannels * bitsPerSample) / 8, true); // ByteRate
@@ -12,7 +12,6 @@ import {
 } from "../services/SelectedTextService";
 import { WavProcessor } from "../helpers/WavProcessor";
 import { AppConfig } from "../config/AppConfig";
-import * as os from "os";
 import * as fs from "fs";
 
 export class GeminiTranscriptionPlugin extends BaseTranscriptionPlugin {
@@ -186,17 +185,8 @@ export class GeminiTranscriptionPlugin extends BaseTranscriptionPlugin {
       return;
     }
 
-    // Convert audio to WAV and process with Gemini
-    const tempDir = os.tmpdir();
-    const wavPath = await WavProcessor.saveAudioAsWav(audioData, tempDir);
-    const audioWavBase64 = fs.readFileSync(wavPath, "base64");
-
-    // Clean up temp file
-    try {
-      fs.unlinkSync(wavPath);
-    } catch (e) {
-      console.warn("Failed to clean up temp WAV file:", e);
-    }
+    // Encode audio as WAV in memory and process with Gemini
+    const audioWavBase64 = WavProcessor.encodeWav(audioData).toString("base64");
 
     // Process with full context (transcription + transformation)
     const result = await this.processAudioWithContext(audioWavBase64);
@@ -5,6 +5,7 @@ import {
   TranscriptionSetupProgress,
 } from "./TranscriptionPlugin";
 import { SegmentUpdate } from "../types/SegmentTypes";
+import { WavProcessor } from "../helpers/WavProcessor";
 import { AppConfig } from "../config/AppConfig";
 import { TransformationService } from "../services/TransformationService";
 import {
@@ -183,8 +184,8 @@ export class MistralTranscriptionPlugin extends BaseTranscriptionPlugin {
     try {
       console.log(`Processing audio segment: ${audioData.length} samples`);
 
-      // Create temporary WAV file for Mistral
-      const tempAudioPath = await this.saveAudioAsWav(audioData);
+      // Encode WAV in memory for Mistral
+      const audioBuffer = WavProcessor.encodeWav(audioData);
 
       // Show in-progress transcription
       const inProgressSegment = {
@@ -200,14 +201,7 @@ export class MistralTranscriptionPlugin extends BaseTranscriptionPlugin {
       });
 
       // Transcribe with Mistral
-      const rawTranscription = await this.transcribeWithMistral(tempAudioPath);
-
-      // Clean up temp file
-      try {
-        fs.unlinkSync(tempAudioPath);
-      } catch (err) {
-        console.warn("Failed to delete temp audio file:", err);
-      }
+      const rawTranscription = await this.transcribeWithMistral(audioBuffer);
 
       // Use uniform post-processing API
       const postProcessed = this.postProcessTranscription(rawTranscription, {
@@ -238,13 +232,12 @@ export class MistralTranscriptionPlugin extends BaseTranscriptionPlugin {
     }
   }
 
-  async transcribeWithMistral(audioPath: string): Promise<string> {
+  async transcribeWithMistral(audioBuffer: Buffer): Promise<string> {
     const apiKey = await this.ensureApiKey();
     if (!apiKey) {
       throw new Error("Mistral API key not configured");
     }
 
-    const audioBuffer = fs.readFileSync(audioPath);
     const audioBase64 = audioBuffer.toString("base64");
 
     const model = this.options.model || "voxtral-mini-latest";
@@ -0,0 +1,354 @@
+import {
+  describe,
+  it,
+  expect,
+  beforeAll,
+  afterAll,
+  beforeEach,
+  mock,
+} from "bun:test";
+import * as http from "http";
+import * as https from "https";
+import { AddressInfo } from "net";
+import { createHash } from "crypto";
+import {
+  existsSync,
+  mkdirSync,
+  mkdtempSync,
+  readFileSync,
+  rmSync,
+  statSync,
+  writeFileSync,
+} from "fs";
+import { tmpdir } from "os";
+import { join } from "path";
+import { WhisperCppTranscriptionPlugin } from "./WhisperCppTranscriptionPlugin";
+import { MODEL_DOWNLOAD_CONFIG } from "../config/Constants";
+
+const HF_BASE = "https://huggingface.co/ggerganov/whisper.cpp/resolve/main/";
+let serverBase = "";
+
+// Serve Hugging Face model requests from the local test server
+mock.module("https", () => ({
+  ...https,
+  get: (url: string, options: any, callback: any) =>
+    http.get(url.replace(HF_BASE, serverBase), options, callback),
+}));
+
+// A repeating pattern with a prime period, so bytes written at the wrong
+// offset never line up with the expected content by accident
+const makeBody = (size: number): Buffer => {
+  const pattern = Buffer.alloc(65521);
+  for (let i = 0; i < pattern.length; i++) pattern[i] = (i * 31 + 7) & 0xff;
+  return Buffer.alloc(size, pattern);
+};
+
+const sha256 = (data: Buffer) =>
+  createHash("sha256").update(data).digest("hex");
+
+const SMALL_BODY = makeBody(3 * 1024 * 1024);
+// Large enough to take the parallel path
+const LARGE_BODY = makeBody(MODEL_DOWNLOAD_CONFIG.PARALLEL_MIN_BYTES + 12345);
+const BODIES: Record<string, { data: Buffer; sha: string }> = {
+  "/small.bin": { data: SMALL_BODY, sha: sha256(SMALL_BODY) },
+  "/large.bin": { data: LARGE_BODY, sha: sha256(LARGE_BODY) },
+};
+
+// Per-test server behaviour
+let rangesSeen: string[] = [];
+let corruptResponses = 0;
+let dropRangeFrom: number | null = null;
+let stallAfterBytes: number | null = null;
+
+const server = http.createServer((req, res) => {
+  const entry = BODIES[req.url ?? ""];
+  if (!entry) {
+    res.writeHead(404);
+    res.end();
+    return;
+  }
+
+  const range = req.headers.range;
+  rangesSeen.push(range ?? "");
+
+  let data = entry.data;
+  if (corruptResponses > 0) {
+    corruptResponses -= 1;
+    data = Buffer.from(data);
+    data[data.length - 1] ^= 0xff;
+  }
+
+  const headers = {
+    "accept-ranges": "bytes",
+    "x-linked-etag": `"${entry.sha}"`,
+  };
+
+  let start = 0;
+  let end = data.length - 1;
+  if (range) {
+    const match = /^bytes=(\d+)-(\d*)$/.exec(range);
+    start = Number(match?.[1] ?? 0);
+    end = match?.[2] ? Number(match[2]) : data.length - 1;
+    if (start >= data.length) {
+      res.writeHead(416, {
+        ...headers,
+        "content-range": `bytes */${data.length}`,
+      });
+      res.end();
+      return;
+    }
+    res.writeHead(206, {
+      ...headers,
+      "content-length": end - start + 1,
+      "content-range": `bytes ${start}-${end}/${data.length}`,
+    });
+  } else {
+    res.writeHead(200, { ...headers, "content-length": data.length });
+  }
+
+  const slice = data.subarray(start, end + 1);
+  if (dropRangeFrom !== null && start === dropRangeFrom) {
+    // Send the start of the body and cut the connection once any other
+    // ranges have had time to land
+    res.write(slice.subarray(0, 1024));
+    setTimeout(() => res.destroy(), 300);
+    return;
+  }
+  if (stallAfterBytes !== null) {
+    // Send the first bytes and then hang until the client gives up
+    res.write(slice.subarray(0, stallAfterBytes));
+    return;
+  }
+  res.end(slice);
+});
+
+describe("WhisperCppTranscriptionPlugin model downloads", () => {
+  let dataDir: string;
+  let modelsDir: string;
+  let plugin: WhisperCppTranscriptionPlugin;
+
+  beforeAll(async () => {
+    await new Promise<void>((resolve) =>
+      server.listen(0, "127.0.0.1", resolve),
+    );
+    const { port } = server.address() as AddressInfo;
+    serverBase = `http://127.0.0.1:${port}/`;
+  });
+
+  afterAll(() => {
+    server.closeAllConnections();
+    server.close();
+  });
+
+  beforeEach(() => {
+    rangesSeen = [];
+    corruptResponses = 0;
+    dropRangeFrom = null;
+    stallAfterBytes = null;
+
+    dataDir = mkdtempSync(join(tmpdir(), "whisper-cpp-download-"));
+    modelsDir = join(dataDir, "models");
+    // Binary lookup joins against Electron's resources path
+    (process as any).resourcesPath = dataDir;
+    const config = { dataDir, getModelsDir: () => modelsDir } as any;
+    plugin = new WhisperCppTranscriptionPlugin(config);
+    // Only the GGML file is under test, not the Core ML bundle
+    (plugin as any).isAppleSilicon = false;
+  });
+
+  const modelPath = (name: string) => join(modelsDir, name);
+  const partialPath = (name: string) => join(modelsDir, `${name}.partial`);
+  const isDownloading = () => (plugin as any).modelManager.isDownloading();
+
+  const writePartial = (name: string, data: Buffer) => {
+    mkdirSync(modelsDir, { recursive: true });
+    writeFileSync(partialPath(name), data);
+  };
+
+  const createUi = (onMessage?: (message: string) => void) => {
+    const messages: string[] = [];
+    const errors: string[] = [];
+    const uiFunctions = {
+      showProgress: (message: string) => {
+        messages.push(message);
+        onMessage?.(message);
+      },
+      hideProgress: () => {},
+      showDownloadProgress: () => {},
+      showError: (error: string) => errors.push(error),
+      showSuccess: () => {},
+      confirmAction: async () => true,
+    };
+    return { uiFunctions, messages, errors };
+  };
+
+  const cleanup = () => {
+    rmSync(dataDir, { recursive: true, force: true });
+    rmSync((plugin as any).tempDir, { recursive: true, force: true });
+  };
+
+  it("downloads and verifies a model", async () => {
+    const { uiFunctions, messages, errors } = createUi();
+
+    await plugin.downloadModel("small.bin", uiFunctions);
+
+    expect(readFileSync(modelPath("small.bin")).equals(SMALL_BODY)).toBe(true);
+    expect(existsSync(partialPath("small.bin"))).toBe(false);
+    expect(messages).toContain("Verifying small.bin...");
+    expect(errors).toEqual([]);
+    expect(isDownloading()).toBe(false);
+    cleanup();
+  });
+
+  it("resumes from an existing partial file", async () => {
+    writePartial("small.bin", SMALL_BODY.subarray(0, 1000));
+
+    await plugin.downloadModel("small.bin");
+
+    expect(rangesSeen).toEqual(["bytes=1000-"]);
+    expect(readFileSync(modelPath("small.bin")).equals(SMALL_BODY)).toBe(true);
+    cleanup();
+  });
+
+  it("keeps a dropped transfer as a partial file and resumes it", async () => {
+    dropRangeFrom = 0;
+
+    const error = await plugin.downloadModel("small.bin").catch((e) => e);
+
+    expect(error).toBeInstanceOf(Error);
+    expect(isDownloading()).toBe(false);
+    expect(existsSync(modelPath("small.bin"))).toBe(false);
+    const kept = statSync(partialPath("small.bin")).size;
+    expect(kept).toBeGreaterThan(0);
+    const prefix = readFileSync(partialPath("small.bin"));
+    expect(prefix.equals(SMALL_BODY.subarray(0, kept))).toBe(true);
+
+    dropRangeFrom = null;
+    rangesSeen = [];
+    await plugin.downloadModel("small.bin");
+
+    expect(rangesSeen).toEqual([`bytes=${kept}-`]);
+    expect(readFileSync(modelPath("small.bin")).equals(SMALL_BODY)).toBe(true);
+    cleanup();
+  });
+
+  it("restarts from scratch when the resume range is not satisfiable", async () => {
+    writePartial("small.bin", Buffer.alloc(SMALL_BODY.length + 10));
+
+    await plugin.downloadModel("small.bin");
+
+    expect(rangesSeen).toEqual([`bytes=${SMALL_BODY.length + 10}-`, ""]);
+    expect(readFileSync(modelPath("small.bin")).equals(SMALL_BODY)).toBe(true);
+    cleanup();
+  });
+
+  it("retries once after a checksum mismatch without reporting an error", async () => {
+    corruptResponses = 1;
+    const { uiFunctions, errors } = createUi();
+
+    await plugin.downloadModel("small.bin", uiFunctions);
+
+    expect(errors).toEqual([]);
+    expect(readFileSync(modelPath("small.bin")).equals(SMALL_BODY)).toBe(true);
+    cleanup();
+  });
+
+  it("fails with a single error when the retry is corrupt too", async () => {
+    corruptResponses = 2;
+    const { uiFunctions, errors } = createUi();
+
+    const error = await plugin
+      .downloadModel("small.bin", uiFunctions)
+      .catch((e) => e);
+
+    expect(error.name).toBe("ChecksumError");
+    expect(errors.length).toBe(1);
+    expect(existsSync(modelPath("small.bin"))).toBe(false);
+    expect(existsSync(partialPath("small.bin"))).toBe(false);
+    expect(isDownloading()).toBe(false);
+    cleanup();
+  });
+
+  it("aborts during checksum verification without installing the file", async () => {
+    const controller = new AbortController();
+    let activeWhileVerifying = false;
+    const { uiFunctions } = createUi((message) => {
+      if (message.startsWith("Verifying")) {
+        activeWhileVerifying = isDownloading();
+        controller.abort();
+      }
+    });
+
+    const error = await plugin
+      .downloadModel("small.bin", uiFunctions, controller.signal)
+      .catch((e) => e);
+    // Let the interrupted hash settle
+    await new Promise((resolve) => setTimeout(resolve, 100));
+
+    expect(activeWhileVerifying).toBe(true);
+    expect(error.name).toBe("AbortError");
+    expect(existsSync(modelPath("small.bin"))).toBe(false);
+    expect(existsSync(partialPath("small.bin"))).toBe(false);
+    expect(isDownloading()).toBe(false);
+    cleanup();
+  });
+
+  it("aborts mid-download and removes the partial file", async () => {
+    stallAfterBytes = 64 * 1024;
+    const controller = new AbortController();
+    const { uiFunctions } = createUi((message) => {
+      if (/\d+%$/.test(message)) controller.abort();
+    });
+
+    const error = await plugin
+      .downloadModel("small.bin", uiFunctions, controller.signal)
+      .catch((e) => e);
+
+    expect(error.name).toBe("AbortError");
+    expect(existsSync(partialPath("small.bin"))).toBe(false);
+    expect(isDownloading()).toBe(false);
+    cleanup();
+  });
+
+  it("downloads large models over parallel ranges", async () => {
+    const connections = MODEL_DOWNLOAD_CONFIG.PARALLEL_CONNECTIONS;
+    const segmentSize = Math.ceil(LARGE_BODY.length / connections);
+
+    await plugin.downloadModel("large.bin");
+
+    const expectedRanges = Array.from({ length: connections }, (_, i) => {
+      const start = i * segmentSize;
+      const end = Math.min(start + segmentSize, LARGE_BODY.length) - 1;
+      return `bytes=${start}-${end}`;
+    });
+    expect(rangesSeen.slice(1).sort()).toEqual(expectedRanges.sort());
+    expect(readFileSync(modelPath("large.bin")).equals(LARGE_BODY)).toBe(true);
+    cleanup();
+  }, 60000);
+
+  it("keeps a resumable prefix when a parallel range fails", async () => {
+    const segmentSize = Math.ceil(
+      LARGE_BODY.length / MODEL_DOWNLOAD_CONFIG.PARALLEL_CONNECTIONS,
+    );
+    dropRangeFrom = segmentSize;
+
+    const error = await plugin.downloadModel("large.bin").catch((e) => e);
+
+    // The partial file is truncated before the failure is reported
+    expect(error).toBeInstanceOf(Error);
+    expect(isDownloading()).toBe(false);
+    const kept = statSync(partialPath("large.bin")).size;
+    expect(kept).toBeGreaterThan(0);
+    expect(kept).toBeLessThanOrEqual(segmentSize);
+    const prefix = readFileSync(partialPath("large.bin"));
+    expect(prefix.equals(LARGE_BODY.subarray(0, kept))).toBe(true);
+
+    dropRangeFrom = null;
+    rangesSeen = [];
+    await plugin.downloadModel("large.bin");
+
+    expect(rangesSeen).toEqual([`bytes=${kept}-`]);
+    expect(readFileSync(modelPath("large.bin")).equals(LARGE_BODY)).toBe(true);
+    cleanup();
+  }, 60000);
+});
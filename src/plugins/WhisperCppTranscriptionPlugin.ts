@@ -10,6 +10,7 @@ import { arch, platform } from "os";
 import { v4 as uuidv4 } from "uuid";
 import { AppConfig } from "../config/AppConfig";
 import { FileSystemService } from "../services/FileSystemService";
+import { ModelManager } from "../services/ModelManager";
 import {
   Segment,
   TranscribedSegment,
@@ -37,6 +38,7 @@ export class WhisperCppTranscriptionPlugin extends BaseTranscriptionPlugin {
   readonly supportsBatchProcessing = true;
 
   private config: AppConfig;
+  private modelManager: ModelManager;
   private sessionUid: string = "";
   private currentSegments: Segment[] = [];
   private whisperBinaryPath: string;
@@ -52,6 +54,7 @@ export class WhisperCppTranscriptionPlugin extends BaseTranscriptionPlugin {
   constructor(config: AppConfig) {
     super();
     this.config = config;
+    this.modelManager = new ModelManager(config);
     this.isAppleSilicon = arch() === "arm64" && platform() === "darwin";
     this.whisperBinaryPath = this.resolveWhisperBinaryPath(); // Keep for backward compatibility
     // Don't set modelPath here - wait for options to be applied
@@ -295,7 +298,10 @@ export class WhisperCppTranscriptionPlugin extends BaseTranscriptionPlugin {
       });
 
       // Create temporary WAV file for whisper.cpp
-      const tempAudioPath = await this.saveAudioAsWav(audioData);
+      // whisper.cpp decodes to float32 internally, so skip int16 quantization
+      const tempAudioPath = await this.saveAudioAsWav(audioData, {
+        bitsPerSample: 32,
+      });
 
       // Transcribe with whisper.cpp
       const rawTranscription =
@@ -920,6 +926,14 @@ export class WhisperCppTranscriptionPlugin extends BaseTranscriptionPlugin {
                 size: stats.size,
                 id: `model:${file}`,
               });
+            } else if (file.endsWith(".bin.partial")) {
+              const stats = require("fs").statSync(modelPath);
+              dataItems.push({
+                name: file.replace(".bin.partial", ""),
+                description: `Incomplete Whisper.cpp model download`,
+                size: stats.size,
+                id: `model:${file}`,
+              });
             } else if (file.endsWith(".mlmodelc")) {
               const dirSize =
                 FileSystemService.calculateDirectorySize(modelPath);
@@ -1041,8 +1055,12 @@ export class WhisperCppTranscriptionPlugin extends BaseTranscriptionPlugin {
           try {
             const stats = require("fs").statSync(filePath);
 
-            // Delete model files and Core ML models
-            if (file.endsWith(".bin") || file.endsWith(".mlmodelc")) {
+            // Delete model files, interrupted downloads and Core ML models
+            if (
+              file.endsWith(".bin") ||
+              file.endsWith(".bin.partial") ||
+              file.endsWith(".mlmodelc")
+            ) {
               if (stats.isDirectory()) {
                 // Core ML models are directories
                 FileSystemService.deleteDirectory(filePath);
@@ -1248,7 +1266,9 @@ export class WhisperCppTranscriptionPlugin extends BaseTranscriptionPlugin {
       // Run a tiny silent segment to keep binary/model hot
       // Bypass transcription state management and call whisper.cpp directly
       const dummy = new Float32Array(16000);
-      const tempAudioPath = await this.saveAudioAsWav(dummy);
+      const tempAudioPath = await this.saveAudioAsWav(dummy, {
+        bitsPerSample: 32,
+      });
 
       try {
         await this.transcribeWithWhisperCpp(tempAudioPath);
@@ -1349,30 +1369,36 @@ export class WhisperCppTranscriptionPlugin extends BaseTranscriptionPlugin {
 
       // Download the main GGML model first
       const modelPath = join(this.config.getModelsDir(), modelName);
-      const ggmlUrl = `https://huggingface.co/ggerganov/whisper.cpp/resolve/main/${modelName}`;
 
       if (!existsSync(modelPath)) {
         if (uiFunctions) {
           uiFunctions.showProgress(`Downloading ${modelName}...`, 10);
         }
 
-        await this.downloadFileWithProgress(
-          ggmlUrl,
-          modelPath,
+        // ModelManager writes to <model>.partial, resumes interrupted
+        // transfers and checks the SHA256 (retrying once) before moving the
+        // file into place, so a truncated or corrupt download never installs
+        await this.modelManager.downloadModel(
           modelName,
           (progress) => {
-            const adjustedProgress = Math.min(Math.round(progress * 0.5), 50); // Use first 50% for main model
-            uiFunctions?.showProgress(
-              `Downloading ${modelName}... ${adjustedProgress}%`,
-              adjustedProgress,
-            );
+            // Failures reject downloadModel and are reported by the catch below
+            if (progress.status !== "downloading") return;
+            const adjustedProgress = Math.min(
+              Math.round((progress.percent ?? 0) * 0.5),
+              50,
+            ); // Use first 50% for main model
+            const message = progress.message.startsWith("Verifying")
+              ? `Verifying ${modelName}...`
+              : `Downloading ${modelName}... ${adjustedProgress}%`;
+            uiFunctions?.showProgress(message, adjustedProgress);
             this.setDownloadProgress({
               status: "downloading",
               progress: adjustedProgress,
-              message: `Downloading ${modelName}... ${adjustedProgress}%`,
+              message,
               modelName,
             });
           },
+          undefined,
           abortSignal,
         );
 
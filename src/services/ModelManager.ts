@@ -7,10 +7,19 @@ import {
   rmSync,
   createWriteStream,
   unlinkSync,
+  renameSync,
+  openSync,
+  ftruncateSync,
+  closeSync,
+  truncateSync,
+  createReadStream,
+  WriteStream,
 } from "fs";
+import { createHash } from "crypto";
 import { AppConfig } from "../config/AppConfig";
+import { MODEL_DOWNLOAD_CONFIG } from "../config/Constants";
 import * as https from "https";
-import { IncomingMessage, ClientRequest } from "http";
+import { IncomingMessage, ClientRequest, OutgoingHttpHeaders } from "http";
 import { pipeline } from "stream";
 import { promisify } from "util";
 
@@ -30,7 +39,13 @@ export class ModelManager {
   private config: AppConfig;
   private activeDownload: string | null = null;
   private activeRequest: ClientRequest | null = null;
+  private activeFileStream: WriteStream | null = null;
+  private parallelRequests: ClientRequest[] = [];
   private activeFilePath: string | null = null;
+  private activeSha256: string | null = null;
+  // Bumped whenever the active download is cancelled, so async steps of an
+  // older attempt can tell they no longer own the (reused) partial path
+  private downloadGeneration = 0;
 
   constructor(config: AppConfig) {
     this.config = config;
@@ -65,6 +80,15 @@ export class ModelManager {
     return join(this.config.getModelsDir(), modelName);
   }
 
+  /**
+   * In-flight downloads are written here and renamed into place once
+   * complete, so an interrupted transfer can be resumed and is never
+   * mistaken for a finished model.
+   */
+  private getPartialPath(modelName: string): string {
+    return `${this.getModelPath(modelName)}.partial`;
+  }
+
   private async downloadModelFile(
     modelName: string,
     onProgress?: (progress: ModelDownloadProgress) => void,
@@ -90,12 +114,24 @@ export class ModelManager {
       }
 
       this.activeDownload = modelName;
-      const modelPath = this.getModelPath(modelName);
-      this.activeFilePath = modelPath;
+      this.activeSha256 = null;
+      const partialPath = this.getPartialPath(modelName);
+      this.activeFilePath = partialPath;
       const ggmlUrl = `https://huggingface.co/ggerganov/whisper.cpp/resolve/main/${modelName}`;
 
+      // Resume from whatever an earlier, interrupted attempt left behind
+      const resumeFrom = existsSync(partialPath)
+        ? statSync(partialPath).size
+        : 0;
+      const headers: OutgoingHttpHeaders =
+        resumeFrom > 0 ? { Range: `bytes=${resumeFrom}-` } : {};
+
       console.log(`Downloading model ${modelName} from ${ggmlUrl}`);
-      onLog?.(`Starting download of ${modelName}`);
+      onLog?.(
+        resumeFrom > 0
+          ? `Resuming download of ${modelName} at ${resumeFrom} bytes`
+          : `Starting download of ${modelName}`,
+      );
 
       onProgress?.({
         status: "starting",
@@ -107,43 +143,86 @@ export class ModelManager {
       // Setup abort handler
       const abortHandler = () => {
         console.log(`[ModelManager] Download aborted for ${modelName}`);
+        const fileStream = this.activeFileStream;
         this.cleanupActiveDownload();
         const error = new Error("Download aborted");
         error.name = "AbortError";
-        reject(error);
+        if (!fileStream || fileStream.closed) {
+          reject(error);
+          return;
+        }
+        // A stream destroyed before its open completes still creates the
+        // file, so settle only once it has closed and the file is gone
+        fileStream.once("close", () => {
+          this.removeStalePartial(partialPath);
+          reject(error);
+        });
       };
 
       if (abortSignal) {
         abortSignal.addEventListener("abort", abortHandler, { once: true });
       }
 
-      const request = https.get(ggmlUrl, (response) => {
+      // Settle through these so the abort listener is dropped once the
+      // download (including checksum verification) has finished
+      const done = (value: boolean) => {
+        abortSignal?.removeEventListener("abort", abortHandler);
+        resolve(value);
+      };
+      const fail = (reason?: any) => {
+        abortSignal?.removeEventListener("abort", abortHandler);
+        reject(reason);
+      };
+
+      // Once a response arrives, its own error handlers own the failure
+      let responded = false;
+      const request = https.get(ggmlUrl, { headers }, (response) => {
+        responded = true;
+        // Hugging Face reports the LFS object's SHA256 in this header
+        const linkedEtag = response.headers["x-linked-etag"];
+        const sha256 =
+          typeof linkedEtag === "string"
+            ? linkedEtag.replace(/^W\//, "").replace(/"/g, "")
+            : "";
+        if (/^[0-9a-f]{64}$/i.test(sha256)) {
+          this.activeSha256 = sha256.toLowerCase();
+        }
+
         if (response.statusCode === 302 || response.statusCode === 301) {
           // Handle redirect
           const redirectUrl = response.headers.location;
+          response.resume();
           if (redirectUrl) {
             this.downloadFromUrl(
-              redirectUrl,
-              modelPath,
+              new URL(redirectUrl, ggmlUrl).toString(),
+              partialPath,
               modelName,
               onProgress,
               onLog,
-              resolve,
-              reject,
+              done,
+              fail,
               abortSignal,
+              undefined,
+              headers,
+              resumeFrom,
             );
           } else {
             this.activeDownload = null;
             this.activeFilePath = null;
-            reject(new Error("Redirect without location header"));
+            fail(new Error("Redirect without location header"));
           }
           return;
         }
 
-        if (response.statusCode !== 200) {
+        if (
+          response.statusCode !== 200 &&
+          response.statusCode !== 206 &&
+          response.statusCode !== 416
+        ) {
+          response.resume();
           this.activeDownload = null;
           this.activeFilePath = null;
-          reject(
+          fail(
             new Error(`Failed to download model: HTTP ${response.statusCode}`),
           );
           return;
@@ -151,20 +230,23 @@ export class ModelManager {
 
         this.downloadFromUrl(
           ggmlUrl,
-          modelPath,
+          partialPath,
           modelName,
           onProgress,
           onLog,
-          resolve,
-          reject,
+          done,
+          fail,
           abortSignal,
           response,
+          headers,
+          resumeFrom,
         );
       });
 
       this.activeRequest = request;
 
       request.on("error", (error) => {
+        if (responded) return;
         if (abortSignal) {
           abortSignal.removeEventListener("abort", abortHandler);
         }
@@ -193,6 +275,8 @@ export class ModelManager {
     reject?: (reason?: any) => void,
     abortSignal?: AbortSignal,
     response?: IncomingMessage,
+    headers: OutgoingHttpHeaders = {},
+    resumeFrom: number = 0,
   ): void {
     // Check if already aborted
     if (abortSignal?.aborted) {
@@ -202,9 +286,11 @@ export class ModelManager {
       return;
     }
 
+    let responded = false;
     const actualRequest = response
       ? null
-      : https.get(url, (res) => {
+      : https.get(url, { headers }, (res) => {
+          responded = true;
           this.handleDownloadResponse(
             res,
             filePath,
@@ -214,6 +300,8 @@ export class ModelManager {
             resolve,
             reject,
             abortSignal,
+            resumeFrom,
+            url,
           );
         });
 
@@ -227,12 +315,15 @@ export class ModelManager {
         resolve,
         reject,
         abortSignal,
+        resumeFrom,
+        url,
       );
     }
 
     if (actualRequest) {
       this.activeRequest = actualRequest;
       actualRequest.on("error", (error) => {
+        if (responded) return;
         this.activeDownload = null;
         this.activeRequest = null;
         this.activeFilePath = null;
@@ -250,8 +341,28 @@ export class ModelManager {
     resolve?: (value: boolean) => void,
     reject?: (reason?: any) => void,
     abortSignal?: AbortSignal,
+    resumeFrom: number = 0,
+    url?: string,
   ): void {
-    if (response.statusCode !== 200) {
+    if (response.statusCode === 416 && resumeFrom > 0) {
+      // The partial file doesn't fit the remote object; start over
+      console.log(
+        `[ModelManager] Range not satisfiable for ${modelName}, restarting download`,
+      );
+      response.resume();
+      this.cleanupPartialDownload(filePath);
+      this.activeDownload = null;
+      this.activeRequest = null;
+      this.activeFilePath = null;
+      this.downloadModelFile(modelName, onProgress, onLog, abortSignal).then(
+        (value) => resolve?.(value),
+        reject,
+      );
+      return;
+    }
+
+    if (response.statusCode !== 200 && response.statusCode !== 206) {
+      response.resume();
       this.activeDownload = null;
       this.activeRequest = null;
       this.activeFilePath = null;
@@ -259,6 +370,12 @@ export class ModelManager {
       return;
     }
 
+    // A plain 200 means the server ignored our Range header
+    const resuming = response.statusCode === 206;
+    if (!resuming && resumeFrom > 0) {
+      onLog?.(`Server does not support resume, restarting ${modelName}`);
+    }
+
     // Check if already aborted
     if (abortSignal?.aborted) {
       response.destroy();
@@ -268,39 +385,69 @@ export class ModelManager {
       return;
     }
 
-    const totalBytes = parseInt(response.headers["content-length"] || "0", 10);
-    let downloadedBytes = 0;
+    const offset = resuming ? resumeFrom : 0;
+    const contentLength = parseInt(
+      response.headers["content-length"] || "0",
+      10,
+    );
+    const totalBytes = contentLength > 0 ? offset + contentLength : 0;
+
+    if (
+      url &&
+      !resuming &&
+      response.headers["accept-ranges"] === "bytes" &&
+      contentLength >= MODEL_DOWNLOAD_CONFIG.PARALLEL_MIN_BYTES
+    ) {
+      // Large file on a range-capable server: fetch it over several connections
+      response.destroy();
+      this.activeRequest = null;
+      this.downloadInParallel(
+        url,
+        filePath,
+        contentLength,
+        modelName,
+        onProgress,
+        onLog,
+        resolve,
+        reject,
+        abortSignal,
+      );
+      return;
+    }
+
+    let downloadedBytes = offset;
     let aborted = false;
+    const generation = this.downloadGeneration;
 
-    const fileStream = createWriteStream(filePath);
+    const fileStream = createWriteStream(filePath, {
+      flags: resuming ? "a" : "w",
+    });
+    this.activeFileStream = fileStream;
 
-    // Setup abort handler for this response
+    // downloadModelFile's own abort handler clears the active state, removes
+    // the partial file and rejects once this stream has closed; here we only
+    // stop the transfer
     const abortHandler = () => {
       if (aborted) return;
       aborted = true;
       console.log(`[ModelManager] Aborting download response for ${modelName}`);
       response.destroy();
       fileStream.destroy();
-      this.cleanupPartialDownload(filePath);
-      this.activeDownload = null;
-      this.activeRequest = null;
-      this.activeFilePath = null;
-      const error = new Error("Download aborted");
-      error.name = "AbortError";
-      reject?.(error);
     };
 
     if (abortSignal) {
       abortSignal.addEventListener("abort", abortHandler, { once: true });
     }
 
+    const initialPercent =
+      totalBytes > 0 ? Math.round((offset / totalBytes) * 100) : 0;
     onProgress?.({
       status: "downloading",
       message: "Downloading model...",
       modelRepoId: modelName,
-      progress: 0,
-      percent: 0,
-      downloadedBytes: 0,
+      progress: initialPercent,
+      percent: initialPercent,
+      downloadedBytes: offset,
       totalBytes,
     });
 
@@ -323,37 +470,185 @@ export class ModelManager {
 
     response.pipe(fileStream);
 
+    // Settle a failed transfer only once the file stream has closed, so its
+    // descriptor is released and a retry never stats or appends to the
+    // partial file while buffered writes are still landing
+    const fail = (error: Error) => {
+      if (aborted) return;
+      aborted = true;
+      if (abortSignal) {
+        abortSignal.removeEventListener("abort", abortHandler);
+      }
+      response.destroy();
+      fileStream.destroy();
+      if (this.activeFileStream === fileStream) {
+        this.activeFileStream = null;
+      }
+
+      const settle = () => {
+        if (generation !== this.downloadGeneration) {
+          // cancelDownload already cleared the state; the file may have been
+          // recreated by a stream that was still opening
+          this.removeStalePartial(filePath);
+          const abortError = new Error("Download aborted");
+          abortError.name = "AbortError";
+          reject?.(abortError);
+          return;
+        }
+        this.activeDownload = null;
+        this.activeRequest = null;
+        this.activeFilePath = null;
+        console.error(`Download error: ${error.message}`);
+        onProgress?.({
+          status: "error",
+          message: `Download failed: ${error.message}`,
+          modelRepoId: modelName,
+          progress: 0,
+        });
+        reject?.(error);
+      };
+
+      if (fileStream.closed) settle();
+      else fileStream.once("close", settle);
+    };
+
     fileStream.on("finish", () => {
       if (aborted) return;
+
+      if (totalBytes > 0 && downloadedBytes < totalBytes) {
+        // Connection dropped mid-transfer; keep the partial file for resume
+        fail(
+          new Error(
+            `Download incomplete: received ${downloadedBytes} of ${totalBytes} bytes`,
+          ),
+        );
+        return;
+      }
+
       if (abortSignal) {
         abortSignal.removeEventListener("abort", abortHandler);
       }
+      if (this.activeFileStream === fileStream) {
+        this.activeFileStream = null;
+      }
+      this.finalizeDownload(
+        filePath,
+        modelName,
+        onProgress,
+        onLog,
+        resolve,
+        reject,
+        abortSignal,
+      );
+    });
+
+    fileStream.on("error", fail);
+    response.on("error", fail);
+  }
+
+  /**
+   * Download a file as several concurrent byte ranges, each written at its
+   * own offset in a pre-sized file
+   */
+  private downloadInParallel(
+    url: string,
+    filePath: string,
+    totalBytes: number,
+    modelName: string,
+    onProgress?: (progress: ModelDownloadProgress) => void,
+    onLog?: (line: string) => void,
+    resolve?: (value: boolean) => void,
+    reject?: (reason?: any) => void,
+    abortSignal?: AbortSignal,
+  ): void {
+    const connections = MODEL_DOWNLOAD_CONFIG.PARALLEL_CONNECTIONS;
+    const segmentSize = Math.ceil(totalBytes / connections);
+    const requests: ClientRequest[] = [];
+    const streams: WriteStream[] = [];
+    let downloadedBytes = 0;
+    let remaining = connections;
+    let settled = false;
+    const generation = this.downloadGeneration;
+
+    console.log(
+      `[ModelManager] Downloading ${modelName} over ${connections} connections`,
+    );
+    onLog?.(`Downloading ${modelName} over ${connections} connections`);
+
+    try {
+      const fd = openSync(filePath, "w");
+      try {
+        ftruncateSync(fd, totalBytes);
+      } finally {
+        closeSync(fd);
+      }
+    } catch (error: any) {
       this.activeDownload = null;
-      this.activeRequest = null;
       this.activeFilePath = null;
-      console.log(`Model ${modelName} downloaded successfully to ${filePath}`);
-      onLog?.(`Download completed: ${modelName}`);
+      reject?.(error);
+      return;
+    }
 
-      onProgress?.({
-        status: "complete",
-        message: "Model downloaded successfully",
-        modelRepoId: modelName,
-        progress: 100,
-        percent: 100,
-      });
+    this.parallelRequests = requests;
 
-      resolve?.(true);
-    });
+    const stopAll = (): Promise<void> => {
+      for (const req of requests) req.destroy();
+      for (const stream of streams) stream?.destroy();
+      this.parallelRequests = [];
+      return Promise.all(
+        streams.map(
+          (stream) =>
+            new Promise<void>((done) => {
+              if (!stream || stream.closed) done();
+              else stream.once("close", () => done());
+            }),
+        ),
+      ).then(() => undefined);
+    };
 
-    fileStream.on("error", (error) => {
-      if (aborted) return;
+    // downloadModelFile's own abort handler clears the active state, removes
+    // the partial file and rejects; here we only stop the segment streams
+    const abortHandler = () => {
+      if (settled) return;
+      settled = true;
+      console.log(`[ModelManager] Aborting parallel download for ${modelName}`);
+      stopAll();
+    };
+
+    if (abortSignal) {
+      abortSignal.addEventListener("abort", abortHandler, { once: true });
+    }
+
+    const fail = async (error: Error) => {
+      if (settled) return;
+      settled = true;
       if (abortSignal) {
         abortSignal.removeEventListener("abort", abortHandler);
       }
+
+      // Stop every writer before touching the file, and only report the
+      // failure once the partial file is in a resumable state
+      await stopAll();
+
+      if (generation !== this.downloadGeneration) {
+        // cancelDownload already removed the file and cleared the state
+        const abortError = new Error("Download aborted");
+        abortError.name = "AbortError";
+        reject?.(abortError);
+        return;
+      }
+
+      // Only the first segment is contiguous from byte 0; keep exactly that
+      // much so the next attempt can resume with a single Range request
+      try {
+        truncateSync(filePath, streams[0]?.bytesWritten ?? 0);
+      } catch {
+        this.cleanupPartialDownload(filePath);
+      }
       this.activeDownload = null;
       this.activeRequest = null;
       this.activeFilePath = null;
-      console.error(`File write error: ${error.message}`);
+      console.error(`Download error: ${error.message}`);
       onProgress?.({
         status: "error",
         message: `Download failed: ${error.message}`,
@@ -361,24 +656,251 @@ export class ModelManager {
         progress: 0,
       });
       reject?.(error);
+    };
+
+    const fetchSegment = (
+      index: number,
+      target: string,
+      start: number,
+      end: number,
+      redirects: number = 0,
+    ) => {
+      const req = https.get(
+        target,
+        { headers: { Range: `bytes=${start}-${end}` } },
+        (res) => {
+          if (settled) {
+            res.destroy();
+            return;
+          }
+
+          const location = res.headers.location;
+          if (
+            (res.statusCode === 301 ||
+              res.statusCode === 302 ||
+              res.statusCode === 307) &&
+            location &&
+            redirects < 5
+          ) {
+            res.resume();
+            fetchSegment(
+              index,
+              new URL(location, target).toString(),
+              start,
+              end,
+              redirects + 1,
+            );
+            return;
+          }
+
+          if (res.statusCode !== 206) {
+            res.resume();
+            fail(new Error(`Failed to download range: HTTP ${res.statusCode}`));
+            return;
+          }
+
+          const stream = createWriteStream(filePath, { flags: "r+", start });
+          streams[index] = stream;
+          let received = 0;
+
+          res.on("data", (chunk: Buffer) => {
+            if (settled) return;
+            received += chunk.length;
+            downloadedBytes += chunk.length;
+            const percent = Math.round((downloadedBytes / totalBytes) * 100);
+
+            onProgress?.({
+              status: "downloading",
+              message: `Downloading model... ${percent}%`,
+              modelRepoId: modelName,
+              progress: percent,
+              percent,
+              downloadedBytes,
+              totalBytes,
+            });
+          });
+
+          res.on("error", fail);
+          stream.on("error", fail);
+          stream.on("finish", () => {
+            if (settled) return;
+            if (received !== end - start + 1) {
+              fail(
+                new Error(
+                  `Download incomplete: range ${start}-${end} received ${received} bytes`,
+                ),
+              );
+              return;
+            }
+            remaining -= 1;
+            if (remaining > 0) return;
+
+            settled = true;
+            if (abortSignal) {
+              abortSignal.removeEventListener("abort", abortHandler);
+            }
+            this.parallelRequests = [];
+            this.finalizeDownload(
+              filePath,
+              modelName,
+              onProgress,
+              onLog,
+              resolve,
+              reject,
+              abortSignal,
+            );
+          });
+
+          res.pipe(stream);
+        },
+      );
+
+      requests.push(req);
+      req.on("error", fail);
+    };
+
+    onProgress?.({
+      status: "downloading",
+      message: "Downloading model...",
+      modelRepoId: modelName,
+      progress: 0,
+      percent: 0,
+      downloadedBytes: 0,
+      totalBytes,
     });
 
-    response.on("error", (error: Error) => {
-      if (aborted) return;
-      if (abortSignal) {
-        abortSignal.removeEventListener("abort", abortHandler);
-      }
+    for (let i = 0; i < connections; i++) {
+      const start = i * segmentSize;
+      const end = Math.min(start + segmentSize, totalBytes) - 1;
+      fetchSegment(i, url, start, end);
+    }
+  }
+
+  /**
+   * Verify a fully downloaded file, move it into place and report completion.
+   * The download stays active until this settles so it can still be cancelled
+   */
+  private async finalizeDownload(
+    filePath: string,
+    modelName: string,
+    onProgress?: (progress: ModelDownloadProgress) => void,
+    onLog?: (line: string) => void,
+    resolve?: (value: boolean) => void,
+    reject?: (reason?: any) => void,
+    abortSignal?: AbortSignal,
+  ): Promise<void> {
+    const expectedSha256 = this.activeSha256;
+    this.activeSha256 = null;
+    const generation = this.downloadGeneration;
+
+    const settle = () => {
       this.activeDownload = null;
       this.activeRequest = null;
       this.activeFilePath = null;
-      console.error(`Download error: ${error.message}`);
+    };
+
+    // Aborting or cancelling runs cleanupActiveDownload, which bumps the
+    // generation, clears the active state and removes the partial file
+    const isCancelled = () =>
+      abortSignal?.aborted === true || generation !== this.downloadGeneration;
+
+    const rejectCancelled = () => {
+      if (generation === this.downloadGeneration) {
+        this.cleanupPartialDownload(filePath);
+        settle();
+      }
+      console.log(`[ModelManager] Download of ${modelName} cancelled`);
+      const error = new Error("Download aborted");
+      error.name = "AbortError";
+      reject?.(error);
+    };
+
+    if (expectedSha256) {
       onProgress?.({
-        status: "error",
-        message: `Download failed: ${error.message}`,
+        status: "downloading",
+        message: "Verifying model checksum...",
         modelRepoId: modelName,
-        progress: 0,
+        progress: 100,
+        percent: 100,
       });
+
+      let actualSha256: string;
+      try {
+        actualSha256 = await this.computeSha256(filePath);
+      } catch (error: any) {
+        if (isCancelled()) {
+          rejectCancelled();
+          return;
+        }
+        settle();
+        console.error(`Failed to verify model file: ${error.message}`);
+        reject?.(error);
+        return;
+      }
+
+      if (isCancelled()) {
+        rejectCancelled();
+        return;
+      }
+
+      if (actualSha256 !== expectedSha256) {
+        this.cleanupPartialDownload(filePath);
+        settle();
+        const error = new Error(
+          `Checksum mismatch for ${modelName}: expected ${expectedSha256}, got ${actualSha256}`,
+        );
+        error.name = "ChecksumError";
+        console.error(error.message);
+        // No error progress here: downloadModel retries once and reports
+        // the failure itself if the retry fails too
+        reject?.(error);
+        return;
+      }
+
+      onLog?.(`Checksum verified: ${modelName}`);
+    } else {
+      onLog?.(`No checksum available for ${modelName}, skipping verification`);
+    }
+
+    if (isCancelled()) {
+      rejectCancelled();
+      return;
+    }
+
+    const modelPath = this.getModelPath(modelName);
+    try {
+      renameSync(filePath, modelPath);
+    } catch (error: any) {
+      settle();
+      console.error(`Failed to finalize model file: ${error.message}`);
       reject?.(error);
+      return;
+    }
+    settle();
+    console.log(`Model ${modelName} downloaded successfully to ${modelPath}`);
+    onLog?.(`Download completed: ${modelName}`);
+
+    onProgress?.({
+      status: "complete",
+      message: "Model downloaded successfully",
+      modelRepoId: modelName,
+      progress: 100,
+      percent: 100,
+    });
+
+    resolve?.(true);
+  }
+
+  /**
+   * Stream a file through SHA256 without loading it into memory
+   */
+  private computeSha256(filePath: string): Promise<string> {
+    return new Promise((resolve, reject) => {
+      const hash = createHash("sha256");
+      const stream = createReadStream(filePath, { highWaterMark: 1 << 20 });
+      stream.on("data", (chunk) => hash.update(chunk));
+      stream.on("error", reject);
+      stream.on("end", () => resolve(hash.digest("hex")));
     });
   }
 
@@ -393,7 +915,39 @@ export class ModelManager {
     abortSignal?: AbortSignal,
   ): Promise<boolean> {
     this.ensureDataDirectory();
-    return this.downloadModelFile(modelName, onProgress, onLog, abortSignal);
+    try {
+      return await this.downloadModelFile(
+        modelName,
+        onProgress,
+        onLog,
+        abortSignal,
+      );
+    } catch (error: any) {
+      if (error?.name !== "ChecksumError") throw error;
+      // The corrupt file has been removed; a single fresh attempt is enough
+      console.log(
+        `[ModelManager] Retrying ${modelName} after checksum mismatch`,
+      );
+      onLog?.(`Checksum mismatch, retrying download of ${modelName}`);
+      try {
+        return await this.downloadModelFile(
+          modelName,
+          onProgress,
+          onLog,
+          abortSignal,
+        );
+      } catch (retryError: any) {
+        if (retryError?.name === "ChecksumError") {
+          onProgress?.({
+            status: "error",
+            message: `Download failed: ${retryError.message}`,
+            modelRepoId: modelName,
+            progress: 0,
+          });
+        }
+        throw retryError;
+      }
+    }
   }
 
   isModelDownloaded(modelName: string): boolean {
@@ -431,6 +985,7 @@ export class ModelManager {
     const filePath = this.getModelPath(modelName);
     try {
       if (existsSync(filePath)) rmSync(filePath, { force: true });
+      rmSync(this.getPartialPath(modelName), { force: true });
     } catch (e) {
       console.error("Failed to delete model file:", filePath, e);
     }
@@ -459,17 +1014,39 @@ export class ModelManager {
       this.activeRequest = null;
     }
 
+    for (const request of this.parallelRequests) {
+      request.destroy();
+    }
+    this.parallelRequests = [];
+
+    if (this.activeFileStream) {
+      this.activeFileStream.destroy();
+      this.activeFileStream = null;
+    }
+
     if (this.activeFilePath) {
       this.cleanupPartialDownload(this.activeFilePath);
       this.activeFilePath = null;
     }
 
     this.activeDownload = null;
+    this.activeSha256 = null;
+    this.downloadGeneration += 1;
   }
 
   /**
    * Remove a partial download file
    */
+  /**
+   * Remove a cancelled download's partial file unless a newer attempt has
+   * already claimed the same path
+   */
+  private removeStalePartial(filePath: string): void {
+    if (this.activeFilePath !== filePath) {
+      this.cleanupPartialDownload(filePath);
+    }
+  }
+
   private cleanupPartialDownload(filePath: string): void {
     try {
       if (existsSync(filePath)) {